@@ -116,6 +116,20 @@ def _initialize_cli(
     initialize_project_at(path=root)
 
 
+def _install_gpu_dataframes() -> None:
+    """Route pandas through cudf.pandas, falling back to CPU pandas per operation.
+
+    This must run before pandas is first imported, which is why the CLI modules
+    that pull in pandas are imported lazily inside the commands.
+    """
+    try:
+        import cudf.pandas  # type: ignore
+    except ImportError as e:
+        msg = "GPU dataframes require RAPIDS cuDF. Install it or run without --gpu-dataframes."
+        raise typer.BadParameter(msg) from e
+    cudf.pandas.install()
+
+
 @app.command("index")
 def _index_cli(
     config: Annotated[
@@ -171,8 +185,17 @@ def _index_cli(
             resolve_path=True,
         ),
     ] = None,
+    gpu_dataframes: Annotated[
+        bool,
+        typer.Option(
+            help="Accelerate pandas operations on the GPU with cudf.pandas. Requires RAPIDS cuDF to be installed."
+        ),
+    ] = False,
 ):
     """Build a knowledge graph index."""
+    if gpu_dataframes:
+        _install_gpu_dataframes()
+
     from graphrag.cli.index import index_cli
 
     index_cli(
@@ -604,6 +604,12 @@ def create_graphrag_config(
                 or defs.DRIFT_SEARCH_PRIMER_FOLDS,
                 primer_llm_max_tokens=reader.int("primer_llm_max_tokens")
                 or defs.DRIFT_SEARCH_PRIMER_MAX_TOKENS,
+                primer_concurrency=reader.int("primer_concurrency")
+                or defs.DRIFT_SEARCH_PRIMER_CONCURRENCY,
+                primer_use_batch_api=reader.bool("primer_use_batch_api")
+                or defs.DRIFT_SEARCH_PRIMER_USE_BATCH_API,
+                primer_batch_timeout=reader.float("primer_batch_timeout")
+                or defs.DRIFT_SEARCH_PRIMER_BATCH_TIMEOUT,
                 n_depth=reader.int("n_depth") or defs.DRIFT_N_DEPTH,
                 local_search_text_unit_prop=reader.float("local_search_text_unit_prop")
                 or defs.DRIFT_LOCAL_SEARCH_TEXT_UNIT_PROP,
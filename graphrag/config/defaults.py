@@ -148,6 +148,9 @@ DRIFT_SEARCH_CONCURRENCY = 32
 DRIFT_SEARCH_K_FOLLOW_UPS = 20
 DRIFT_SEARCH_PRIMER_FOLDS = 5
 DRIFT_SEARCH_PRIMER_MAX_TOKENS = 12_000
+DRIFT_SEARCH_PRIMER_CONCURRENCY = 8
+DRIFT_SEARCH_PRIMER_USE_BATCH_API = False
+DRIFT_SEARCH_PRIMER_BATCH_TIMEOUT = 24 * 60 * 60
 
 DRIFT_LOCAL_SEARCH_TEXT_UNIT_PROP = 0.9
 DRIFT_LOCAL_SEARCH_COMMUNITY_PROP = 0.1
@@ -55,6 +55,23 @@ class DRIFTSearchConfig(BaseModel):
         default=defs.DRIFT_SEARCH_PRIMER_MAX_TOKENS,
     )
 
+    primer_concurrency: int = Field(
+        description="The number of concurrent LLM requests in primer.",
+        default=defs.DRIFT_SEARCH_PRIMER_CONCURRENCY,
+        gt=0,
+    )
+
+    primer_use_batch_api: bool = Field(
+        description="Whether to submit primer requests through the OpenAI Batch API.",
+        default=defs.DRIFT_SEARCH_PRIMER_USE_BATCH_API,
+    )
+
+    primer_batch_timeout: float = Field(
+        description="The maximum number of seconds to wait for a primer batch to complete.",
+        default=defs.DRIFT_SEARCH_PRIMER_BATCH_TIMEOUT,
+        gt=0,
+    )
+
     n_depth: int = Field(
         description="The number of drift search steps to take.",
         default=defs.DRIFT_N_DEPTH,
@@ -23,12 +23,17 @@ def create_final_communities(
 
     # aggregate relationships ids for each community
     # these are limited to only those where the source and target are in the same community
-    max_level = base_communities["level"].max()
-    all_grouped = pd.DataFrame(
-        columns=["community", "level", "relationship_ids", "text_unit_ids"]  # type: ignore
-    )
-    for level in range(max_level + 1):
-        communities_at_level = base_communities.loc[base_communities["level"] == level]
+    # communities are partitioned by level in a single groupby pass,
+    # rather than re-scanning the whole frame with a boolean mask for every level
+    grouped_columns = [
+        "community",
+        "level",
+        "parent",
+        "relationship_ids",
+        "text_unit_ids",
+    ]
+    level_groups = []
+    for _, communities_at_level in base_communities.groupby("level", sort=True):
         sources = base_relationship_edges.merge(
             communities_at_level, left_on="source", right_on="title", how="inner"
         )
@@ -50,12 +55,12 @@ def create_final_communities(
             },
             inplace=True,
         )
-        all_grouped = pd.concat([
-            all_grouped,
-            grouped.loc[
-                :, ["community", "level", "parent", "relationship_ids", "text_unit_ids"]
-            ],
-        ])
+        level_groups.append(grouped.loc[:, grouped_columns])
+    all_grouped = (
+        pd.concat(level_groups)
+        if level_groups
+        else pd.DataFrame(columns=grouped_columns)  # type: ignore
+    )
 
     # deduplicate the lists
     all_grouped["relationship_ids"] = all_grouped["relationship_ids"].apply(
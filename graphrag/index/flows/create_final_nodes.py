@@ -12,6 +12,10 @@ from graphrag.index.operations.create_graph import create_graph
 from graphrag.index.operations.embed_graph.embed_graph import embed_graph
 from graphrag.index.operations.layout_graph.layout_graph import layout_graph
 
+# both sides of each join share one arrow-backed string dtype, so pandas doesn't
+# coerce mismatched keys and hashes arrow strings rather than python objects
+_JOIN_KEY_DTYPE = "string[pyarrow]"
+
 
 def create_final_nodes(
     base_entity_nodes: pd.DataFrame,
@@ -38,25 +42,33 @@ def create_final_nodes(
 
     degrees = compute_degree(graph)
 
+    # the lookups are keyed by title, so join on their index instead of hash-merging.
+    # the entities are indexed by a cast copy of their titles, so the output title
+    # column keeps its own dtype. only the output columns are projected in, in output
+    # order, so unused (wide) columns such as descriptions are never copied and no
+    # final projection is needed.
     nodes = (
-        base_entity_nodes.merge(layout, left_on="title", right_on="label", how="left")
-        .merge(degrees, on="title", how="left")
-        .merge(base_communities, on="title", how="left")
+        _index_by_key(
+            base_entity_nodes.loc[:, ["id", "human_readable_id", "title"]], "title"
+        )
+        .join(_index_by_key(base_communities, "title").loc[:, ["community", "level"]])
+        .join(_index_by_key(degrees, "title").loc[:, ["degree"]])
+        .join(
+            # layout coordinates don't need double precision; float32 halves their size
+            _index_by_key(layout, "label")
+            .loc[:, ["x", "y"]]
+            .astype({"x": "float32", "y": "float32"})
+        )
+        .reset_index(drop=True)
     )
-    nodes["level"] = nodes["level"].fillna(0).astype(int)
+    # hierarchy levels are small, so store them compactly
+    nodes["level"] = nodes["level"].fillna(0).astype("int8")
     nodes["community"] = nodes["community"].fillna(-1).astype(int)
     # disconnected nodes and those with no community even at level 0 can be missing degree
     nodes["degree"] = nodes["degree"].fillna(0).astype(int)
-    return nodes.loc[
-        :,
-        [
-            "id",
-            "human_readable_id",
-            "title",
-            "community",
-            "level",
-            "degree",
-            "x",
-            "y",
-        ],
-    ]
+    return nodes
+
+
+def _index_by_key(table: pd.DataFrame, key: str) -> pd.DataFrame:
+    """Index a lookup table by its join key, cast to the shared join key dtype."""
+    return table.set_index(table[key].astype(_JOIN_KEY_DTYPE))
@@ -9,4 +9,14 @@ import pandas as pd
 
 def create_graph(edges_df: pd.DataFrame) -> nx.Graph:
     """Create a networkx graph from nodes and edges dataframes."""
-    return nx.from_pandas_edgelist(edges_df)
+    # read the endpoints out as contiguous numpy arrays once, rather than iterating
+    # the (possibly chunked, arrow-backed) columns like nx.from_pandas_edgelist does
+    graph = nx.Graph()
+    graph.add_edges_from(
+        zip(
+            edges_df["source"].to_numpy(),
+            edges_df["target"].to_numpy(),
+            strict=True,
+        )
+    )
+    return graph
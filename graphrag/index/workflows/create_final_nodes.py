@@ -3,6 +3,8 @@
 
 """A module containing run_workflow method definition."""
 
+import asyncio
+
 import pandas as pd
 
 from graphrag.callbacks.verb_callbacks import VerbCallbacks
@@ -22,14 +24,15 @@ async def run_workflow(
     callbacks: VerbCallbacks,
 ) -> pd.DataFrame | None:
     """All the steps to transform final nodes."""
-    base_entity_nodes = await load_table_from_storage(
-        "base_entity_nodes", context.storage
-    )
-    base_relationship_edges = await load_table_from_storage(
-        "base_relationship_edges", context.storage
-    )
-    base_communities = await load_table_from_storage(
-        "base_communities", context.storage
+    # the input tables are independent, so overlap their storage reads
+    (
+        base_entity_nodes,
+        base_relationship_edges,
+        base_communities,
+    ) = await asyncio.gather(
+        load_table_from_storage("base_entity_nodes", context.storage),
+        load_table_from_storage("base_relationship_edges", context.storage),
+        load_table_from_storage("base_communities", context.storage),
     )
 
     embed_config = config.embed_graph
@@ -247,7 +247,9 @@ def embed_community_reports(
 def _filter_under_community_level(
     df: pd.DataFrame, community_level: int
 ) -> pd.DataFrame:
+    # compare against the raw level array so no intermediate boolean Series is built
+    mask = df["level"].to_numpy() <= community_level
     return cast(
         "pd.DataFrame",
-        df[df.level <= community_level],
+        df.loc[mask],
     )
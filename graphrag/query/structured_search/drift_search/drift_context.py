@@ -66,6 +66,7 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
         self.relationships = relationships
         self.covariates = covariates
         self.embedding_vectorstore_key = embedding_vectorstore_key
+        self.query_processor: PrimerQueryProcessor | None = None
 
         self.local_mixed_context = (
             local_mixed_context or self.init_local_context_builder()
@@ -157,7 +158,7 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
             and isinstance(query_embedding[0], type(embedding[0]))
         )
 
-    def build_context(
+    async def build_context(
         self, query: str, **kwargs
     ) -> tuple[pd.DataFrame, dict[str, int]]:
         """
@@ -184,14 +185,16 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
             )
             raise ValueError(missing_reports_error)
 
-        query_processor = PrimerQueryProcessor(
-            chat_llm=self.chat_llm,
-            text_embedder=self.text_embedder,
-            token_encoder=self.token_encoder,
-            reports=self.reports,
-        )
+        # reuse the processor across queries so its report token counts stay cached
+        if self.query_processor is None:
+            self.query_processor = PrimerQueryProcessor(
+                chat_llm=self.chat_llm,
+                text_embedder=self.text_embedder,
+                token_encoder=self.token_encoder,
+                reports=self.reports,
+            )
 
-        query_embedding, token_ct = query_processor(query)
+        query_embedding, token_ct = await self.query_processor(query)
 
         report_df = self.convert_reports_to_df(self.reports)
 
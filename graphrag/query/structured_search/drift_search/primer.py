@@ -3,15 +3,20 @@
 
 """Primer for DRIFT search."""
 
+import asyncio
 import json
 import logging
-import secrets
 import time
+from typing import cast
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import tiktoken
-from tqdm.asyncio import tqdm_asyncio
+from openai import AsyncAzureOpenAI, AsyncOpenAI
+from openai.types import Batch
+from tqdm import tqdm
 
 from graphrag.config.models.drift_search_config import DRIFTSearchConfig
 from graphrag.model.community_report import CommunityReport
@@ -25,6 +30,23 @@ from graphrag.query.structured_search.base import SearchResult
 
 log = logging.getLogger(__name__)
 
+_BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+_BATCH_MIN_POLL_INTERVAL = 1.0
+_BATCH_MAX_POLL_INTERVAL = 60.0
+# responses above this size are parsed in a worker thread so the event loop keeps
+# serving the other folds
+_JSON_OFFLOAD_THRESHOLD = 64 * 1024
+
+# the primer prompt is split around the per-fold reports once, at import
+_PRIMER_PROMPT_PREFIX, _PRIMER_PROMPT_SUFFIX = DRIFT_PRIMER_PROMPT.split(
+    "{community_reports}"
+)
+
+_EXPANSION_PROMPT = """Create a hypothetical answer to the following query: {query}\n\n
+                  Format it to follow the structure of the template below:\n\n
+                  {template}\n"
+                  Ensure that the hypothetical answer does not reference new named entities that are not present in the original query."""
+
 
 class PrimerQueryProcessor:
     """Process the query by expanding it using community reports and generate follow-up actions."""
@@ -49,8 +71,18 @@ class PrimerQueryProcessor:
         self.text_embedder = text_embedder
         self.token_encoder = token_encoder
         self.reports = reports
+        self._report_contents = [report.full_content for report in reports]
+        # template choice is not security sensitive, so draw from a cached PCG64
+        # generator instead of paying an os.urandom syscall per expansion
+        self._rng = np.random.default_rng()
+        # report token counts are filled lazily as templates get picked, and the
+        # prompt scaffolding is counted once, so each expansion only tokenizes the query
+        self._report_token_counts: dict[int, int] = {}
+        self._prompt_token_count = num_tokens(
+            _EXPANSION_PROMPT.format(query="", template=""), token_encoder
+        )
 
-    def expand_query(self, query: str) -> tuple[str, dict[str, int]]:
+    async def expand_query(self, query: str) -> tuple[str, dict[str, int]]:
         """
         Expand the query using a random community report template.
 
@@ -61,17 +93,21 @@ class PrimerQueryProcessor:
         -------
         tuple[str, dict[str, int]]: Expanded query text and the number of tokens used.
         """
-        template = secrets.choice(self.reports).full_content  # nosec S311
+        index = int(self._rng.integers(len(self._report_contents)))
+        template = self._report_contents[index]
 
-        prompt = f"""Create a hypothetical answer to the following query: {query}\n\n
-                  Format it to follow the structure of the template below:\n\n
-                  {template}\n"
-                  Ensure that the hypothetical answer does not reference new named entities that are not present in the original query."""
+        prompt = _EXPANSION_PROMPT.format(query=query, template=template)
 
         messages = [{"role": "user", "content": prompt}]
 
-        text = self.chat_llm.generate(messages)
-        prompt_tokens = num_tokens(prompt, self.token_encoder)
+        text = await self.chat_llm.agenerate(messages)
+        if index not in self._report_token_counts:
+            self._report_token_counts[index] = num_tokens(template, self.token_encoder)
+        prompt_tokens = (
+            self._prompt_token_count
+            + num_tokens(query, self.token_encoder)
+            + self._report_token_counts[index]
+        )
         output_tokens = num_tokens(text, self.token_encoder)
         token_ct = {
             "llm_calls": 1,
@@ -83,7 +119,7 @@ class PrimerQueryProcessor:
             return query, token_ct
         return text, token_ct
 
-    def __call__(self, query: str) -> tuple[list[float], dict[str, int]]:
+    async def __call__(self, query: str) -> tuple[list[float], dict[str, int]]:
         """
         Call method to process the query, expand it, and embed the result.
 
@@ -94,9 +130,9 @@ class PrimerQueryProcessor:
         -------
         tuple[list[float], int]: List of embeddings for the expanded query and the token count.
         """
-        hyde_query, token_ct = self.expand_query(query)
+        hyde_query, token_ct = await self.expand_query(query)
         log.info("Expanded query: %s", hyde_query)
-        return self.text_embedder.embed(hyde_query), token_ct
+        return await self.text_embedder.aembed(hyde_query), token_ct
 
 
 class DRIFTPrimer:
@@ -115,40 +151,79 @@ class DRIFTPrimer:
             config (DRIFTSearchConfig): Configuration settings for DRIFT search.
             chat_llm (ChatOpenAI): The language model used for searching.
             token_encoder (tiktoken.Encoding, optional): Token encoder for managing tokens.
+
+        Raises
+        ------
+        ValueError: If the Batch API is enabled for an Azure OpenAI client.
         """
+        if config.primer_use_batch_api and isinstance(
+            chat_llm.async_client, AsyncAzureOpenAI
+        ):
+            # Azure batches are addressed by deployment and need a global batch
+            # deployment, which the OpenAI-style requests built here don't target
+            error_msg = "The DRIFT primer Batch API is not supported for Azure OpenAI."
+            raise ValueError(error_msg)
         self.llm = chat_llm
         self.config = config
         self.token_encoder = token_encoder
 
+    def make_prompt(self, query: str) -> tuple[str, str]:
+        """
+        Format the query into the primer prompt around its community reports slot.
+
+        Only the community reports differ between folds, so the template is formatted
+        once per query and each fold's prompt is built as prefix + reports + suffix.
+
+        Args:
+            query (str): The original search query.
+
+        Returns
+        -------
+        tuple[str, str]: The prompt text before and after the community reports.
+        """
+        return (
+            _PRIMER_PROMPT_PREFIX.format(query=query),
+            _PRIMER_PROMPT_SUFFIX.format(query=query),
+        )
+
     async def decompose_query(
-        self, query: str, reports: pd.DataFrame
+        self,
+        community_reports: str,
+        prompt_prefix: str,
+        prompt_suffix: str,
+        fixed_prompt_tokens: int | None = None,
     ) -> tuple[dict, dict[str, int]]:
         """
         Decompose the query into subqueries based on the fetched global structures.
 
         Args:
-            query (str): The original search query.
-            reports (pd.DataFrame): DataFrame containing community reports.
+            community_reports (str): The joined community report contents of the fold.
+            prompt_prefix (str): The primer prompt before the community reports.
+            prompt_suffix (str): The primer prompt after the community reports.
+            fixed_prompt_tokens (int, optional): Token count of the prompt prefix and suffix,
+                which is the same for every fold and can be computed once per query.
 
         Returns
         -------
         tuple[dict, int, int]: Parsed response and the number of prompt and output tokens used.
         """
-        community_reports = "\n\n".join(reports["full_content"].tolist())
-        prompt = DRIFT_PRIMER_PROMPT.format(
-            query=query, community_reports=community_reports
-        )
+        prompt = prompt_prefix + community_reports + prompt_suffix
         messages = [{"role": "user", "content": prompt}]
 
         response = await self.llm.agenerate(
             messages, response_format={"type": "json_object"}
         )
 
-        parsed_response = json.loads(response)
+        parsed_response = await _parse_json_response(response)
 
+        if fixed_prompt_tokens is None:
+            fixed_prompt_tokens = num_tokens(
+                prompt_prefix + prompt_suffix, self.token_encoder
+            )
         token_ct = {
             "llm_calls": 1,
-            "prompt_tokens": num_tokens(prompt, self.token_encoder),
+            "prompt_tokens": fixed_prompt_tokens
+            + num_tokens(community_reports, self.token_encoder),
             "output_tokens": num_tokens(response, self.token_encoder),
         }
 
@@ -170,35 +245,311 @@ class DRIFTPrimer:
         -------
         SearchResult: The search result containing the response and context data.
         """
+        if self.config.primer_use_batch_api:
+            return await self.asearch_batched(query, top_k_reports)
+
+        start_time = time.perf_counter()
+        report_folds = self.fold_report_contents(top_k_reports)
+        prompt_prefix, prompt_suffix = self.make_prompt(query)
+        # the prompt scaffolding is identical across folds, so it is only tokenized once
+        fixed_prompt_tokens = num_tokens(
+            prompt_prefix + prompt_suffix, self.token_encoder
+        )
+
+        # the semaphore is bound to the running event loop, so it is made per search
+        semaphore = asyncio.Semaphore(self.config.primer_concurrency)
+
+        async def decompose_fold(
+            index: int, community_reports: str
+        ) -> tuple[int, tuple[dict, dict[str, int]]]:
+            async with semaphore:
+                return index, await self.decompose_query(
+                    community_reports, prompt_prefix, prompt_suffix, fixed_prompt_tokens
+                )
+
+        tasks = [
+            asyncio.ensure_future(decompose_fold(i, community_reports))
+            for i, community_reports in enumerate(report_folds)
+        ]
+        responses: list[dict] = [{}] * len(tasks)
+        prompt_tokens, output_tokens = 0, 0
+        try:
+            with tqdm(total=len(tasks), leave=False) as progress:
+                for next_result in asyncio.as_completed(tasks):
+                    index, (response, token_ct) = await next_result
+                    responses[index] = response
+                    prompt_tokens += token_ct["prompt_tokens"]
+                    output_tokens += token_ct["output_tokens"]
+                    progress.update()
+        finally:
+            # if a fold fails (or the search is cancelled), stop the remaining folds
+            # rather than leaving them running with unretrieved errors
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        completion_time = time.perf_counter() - start_time
+
+        return SearchResult(
+            response=responses,
+            context_data={"top_k_reports": top_k_reports},
+            context_text=report_folds,
+            completion_time=completion_time,
+            llm_calls=len(responses),
+            prompt_tokens=prompt_tokens,
+            output_tokens=output_tokens,
+        )
+
+    async def asearch_batched(
+        self,
+        query: str,
+        top_k_reports: pd.DataFrame,
+    ) -> SearchResult:
+        """
+        Search method that submits all report folds as a single OpenAI Batch API job.
+
+        Batch jobs are processed by the service within a 24h completion window, so
+        this path is only suitable for latency-tolerant (non-interactive) queries.
+
+        Args:
+            query (str): The search query.
+            top_k_reports (pd.DataFrame): DataFrame containing the top-k reports.
+
+        Returns
+        -------
+        SearchResult: The search result containing the response and context data.
+
+        Raises
+        ------
+        RuntimeError: If the batch job does not complete successfully or all of its
+            requests fail.
+        TimeoutError: If the batch job does not complete within the configured timeout.
+        """
         start_time = time.perf_counter()
-        report_folds = self.split_reports(top_k_reports)
-        tasks = [self.decompose_query(query, fold) for fold in report_folds]
-        results_with_tokens = await tqdm_asyncio.gather(*tasks, leave=False)
+        report_folds = self.fold_report_contents(top_k_reports)
+        prompt_prefix, prompt_suffix = self.make_prompt(query)
+        batch_requests = [
+            {
+                "custom_id": f"fold-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.llm.model,
+                    "messages": [
+                        {
+                            "role": "user",
+                            "content": prompt_prefix
+                            + community_reports
+                            + prompt_suffix,
+                        }
+                    ],
+                    "response_format": {"type": "json_object"},
+                },
+            }
+            for i, community_reports in enumerate(report_folds)
+        ]
+        batch_input = "\n".join(json.dumps(request) for request in batch_requests)
+
+        # Azure clients are rejected on construction, so this is an OpenAI client
+        client = cast("AsyncOpenAI", self.llm.async_client)
+        batch_file = await client.files.create(
+            file=("drift_primer.jsonl", batch_input.encode("utf-8")),
+            purpose="batch",
+        )
+        batch = None
+        try:
+            batch = await client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+
+            try:
+                batch = await asyncio.wait_for(
+                    _poll_batch(client, batch),
+                    self.config.primer_batch_timeout,
+                )
+            except asyncio.TimeoutError as e:
+                error_msg = (
+                    f"DRIFT primer batch {batch.id} did not complete within "
+                    f"{self.config.primer_batch_timeout}s."
+                )
+                raise TimeoutError(error_msg) from e
+            finally:
+                # the service keeps processing (and billing) a batch until it is
+                # cancelled, so cancel it whenever polling stops short of the end
+                if batch.status not in _BATCH_TERMINAL_STATUSES:
+                    await _cancel_batch(client, batch.id)
+
+            if batch.status != "completed" or batch.output_file_id is None:
+                error_msg = (
+                    f"DRIFT primer batch {batch.id} ended with status {batch.status}."
+                )
+                raise RuntimeError(error_msg)
+
+            # requests that failed are written to a separate error file
+            if batch.error_file_id is not None:
+                batch_errors = await client.files.content(batch.error_file_id)
+                for line in batch_errors.text.splitlines():
+                    if line.strip():
+                        result = json.loads(line)
+                        log.warning(
+                            "DRIFT primer batch request %s failed: %s",
+                            result.get("custom_id"),
+                            result.get("error") or result.get("response"),
+                        )
+
+            batch_output = await client.files.content(batch.output_file_id)
+
+            # failed folds are left out, so they neither count as calls nor add empty
+            # responses that would drag down the primer's averaged score
+            fold_responses: dict[int, dict] = {}
+            prompt_tokens, output_tokens = 0, 0
+            for line in batch_output.text.splitlines():
+                if not line.strip():
+                    continue
+                result = json.loads(line)
+                body = (result.get("response") or {}).get("body") or {}
+                if not body.get("choices"):
+                    log.warning(
+                        "DRIFT primer batch request %s failed: %s",
+                        result["custom_id"],
+                        result.get("error"),
+                    )
+                    continue
+                index = int(result["custom_id"].removeprefix("fold-"))
+                fold_responses[index] = await _parse_json_response(
+                    body["choices"][0]["message"]["content"]
+                )
+                usage = body.get("usage") or {}
+                prompt_tokens += usage.get("prompt_tokens", 0)
+                output_tokens += usage.get("completion_tokens", 0)
+
+            if not fold_responses:
+                error_msg = f"All requests of DRIFT primer batch {batch.id} failed."
+                raise RuntimeError(error_msg)
+        finally:
+            # the uploaded reports and the batch results would otherwise stay in the
+            # provider's file store indefinitely
+            await _delete_batch_files(
+                client,
+                batch_file.id,
+                *(
+                    (batch.output_file_id, batch.error_file_id)
+                    if batch is not None
+                    else ()
+                ),
+            )
+
+        responses = [fold_responses[index] for index in sorted(fold_responses)]
 
         completion_time = time.perf_counter() - start_time
 
         return SearchResult(
-            response=[response for response, _ in results_with_tokens],
+            response=responses,
             context_data={"top_k_reports": top_k_reports},
-            context_text=top_k_reports.to_json() or "",
+            context_text=report_folds,
             completion_time=completion_time,
-            llm_calls=len(results_with_tokens),
-            prompt_tokens=sum(ct["prompt_tokens"] for _, ct in results_with_tokens),
-            output_tokens=sum(ct["output_tokens"] for _, ct in results_with_tokens),
+            llm_calls=len(responses),
+            prompt_tokens=prompt_tokens,
+            output_tokens=output_tokens,
         )
 
-    def split_reports(self, reports: pd.DataFrame) -> list[pd.DataFrame]:
+    def split_reports(self, reports: pd.DataFrame) -> list[tuple[int, int]]:
         """
         Split the reports into folds, allowing for parallel processing.
 
+        Folds are returned as (start, end) row positions rather than DataFrame slices,
+        since each fold is only read once to extract its report contents.
+
         Args:
             reports (pd.DataFrame): DataFrame of community reports.
 
         Returns
         -------
-        list[pd.DataFrame]: List of report folds.
+        list[tuple[int, int]]: List of (start, end) positions of each report fold.
         """
         primer_folds = self.config.primer_folds or 1  # Ensure at least one fold
-        if primer_folds == 1:
-            return [reports]
-        return [pd.DataFrame(fold) for fold in np.array_split(reports, primer_folds)]
+
+        # same fold sizes as np.array_split: the first `remainder` folds get one extra
+        fold_size, remainder = divmod(len(reports), primer_folds)
+        bounds = []
+        start = 0
+        for i in range(primer_folds):
+            end = start + fold_size + (1 if i < remainder else 0)
+            bounds.append((start, end))
+            start = end
+        return bounds
+
+    def fold_report_contents(self, reports: pd.DataFrame) -> list[str]:
+        """
+        Split the reports into folds and join the report contents of each fold.
+
+        Args:
+            reports (pd.DataFrame): DataFrame of community reports.
+
+        Returns
+        -------
+        list[str]: The joined community report contents of each fold.
+        """
+        return _join_report_contents(
+            cast("pd.Series", reports["full_content"]), self.split_reports(reports)
+        )
+
+
+def _join_report_contents(
+    full_content: pd.Series, bounds: list[tuple[int, int]]
+) -> list[str]:
+    """Join the report contents of each (start, end) fold with blank lines between reports."""
+    dtype = full_content.dtype
+    if isinstance(dtype, pd.ArrowDtype) or (
+        isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow"
+    ):
+        # arrow-backed strings are joined in C over the contiguous buffer, with
+        # each fold expressed as a list view over the same values
+        values = pa.array(full_content.array)
+        if isinstance(values, pa.ChunkedArray):
+            values = values.combine_chunks()
+        offsets = pa.array([0] + [end for _, end in bounds], type=pa.int32())
+        folds = pa.ListArray.from_arrays(offsets, values)
+        separator = pa.scalar("\n\n", type=values.type)
+        return pc.binary_join(folds, separator).to_pylist()  # type: ignore
+
+    contents = full_content.to_numpy()
+    return ["\n\n".join(contents[start:end]) for start, end in bounds]
+
+
+async def _parse_json_response(response: str) -> dict:
+    """Parse a JSON primer response, in a worker thread if it is large."""
+    if len(response) > _JSON_OFFLOAD_THRESHOLD:
+        return await asyncio.to_thread(json.loads, response)
+    return json.loads(response)
+
+
+async def _poll_batch(client: AsyncOpenAI, batch: Batch) -> Batch:
+    """Poll a batch with exponential backoff until it reaches a terminal status."""
+    poll_interval = _BATCH_MIN_POLL_INTERVAL
+    while batch.status not in _BATCH_TERMINAL_STATUSES:
+        await asyncio.sleep(poll_interval)
+        poll_interval = min(poll_interval * 2, _BATCH_MAX_POLL_INTERVAL)
+        batch = await client.batches.retrieve(batch.id)
+    return batch
+
+
+async def _cancel_batch(client: AsyncOpenAI, batch_id: str) -> None:
+    """Cancel a batch that is no longer waited on, logging rather than raising on failure."""
+    try:
+        await client.batches.cancel(batch_id)
+    except Exception:
+        log.exception("Failed to cancel DRIFT primer batch %s", batch_id)
+
+
+async def _delete_batch_files(client: AsyncOpenAI, *file_ids: str | None) -> None:
+    """Delete the files of a batch, logging rather than raising on failure."""
+    for file_id in file_ids:
+        if file_id is None:
+            continue
+        try:
+            await client.files.delete(file_id)
+        except Exception:
+            log.exception("Failed to delete DRIFT primer batch file %s", file_id)
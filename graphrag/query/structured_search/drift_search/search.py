@@ -197,7 +197,7 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
         # Check if query state is empty
         if not self.query_state.graph:
             # Prime the search with the primer
-            primer_context, token_ct = self.context_builder.build_context(query)
+            primer_context, token_ct = await self.context_builder.build_context(query)
             llm_calls["build_context"] = token_ct["llm_calls"]
             prompt_tokens["build_context"] = token_ct["prompt_tokens"]
             output_tokens["build_context"] = token_ct["prompt_tokens"]
@@ -0,0 +1,22 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from graphrag.cli.main import app
+
+
+def test_index_gpu_dataframes_requires_cudf(monkeypatch: pytest.MonkeyPatch):
+    # a None entry makes any import of cudf fail, whether or not it is installed
+    monkeypatch.setitem(sys.modules, "cudf", None)
+
+    # a wide terminal keeps the error panel from wrapping the message
+    result = CliRunner().invoke(
+        app, ["index", "--gpu-dataframes"], env={"COLUMNS": "200"}
+    )
+
+    assert result.exit_code == 2
+    assert "GPU dataframes require RAPIDS cuDF" in result.output
@@ -0,0 +1,450 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+import json
+import re
+from types import SimpleNamespace
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+from openai import AsyncAzureOpenAI
+from pydantic import ValidationError
+
+from graphrag.config.models.drift_search_config import DRIFTSearchConfig
+from graphrag.model.community_report import CommunityReport
+from graphrag.query.structured_search.drift_search import primer as primer_module
+from graphrag.query.structured_search.drift_search.primer import (
+    DRIFTPrimer,
+    PrimerQueryProcessor,
+)
+
+
+class MockTokenEncoder:
+    def encode(self, text: str) -> list[str]:
+        return text.split()
+
+
+class MockChatLLM:
+    def __init__(self) -> None:
+        self.active = 0
+        self.max_active = 0
+
+    async def agenerate(self, messages: list[Any], **kwargs: Any) -> str:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        prompt = messages[0]["content"]
+        reports = re.findall(r"report-(\d+)", prompt)
+        # finish later folds first so completion order differs from fold order
+        await asyncio.sleep(0.01 / (1 + int(reports[0])))
+        self.active -= 1
+        return json.dumps({"reports": reports})
+
+
+class MockPaddedChatLLM:
+    def __init__(self, padding: int, fenced: bool = False) -> None:
+        self.padding = padding
+        self.fenced = fenced
+
+    async def agenerate(self, messages: list[Any], **kwargs: Any) -> str:
+        reports = re.findall(r"report-(\d+)", messages[0]["content"])
+        content = json.dumps({"reports": reports, "padding": "x" * self.padding})
+        return f"```json\n{content}\n```" if self.fenced else content
+
+
+class MockBatchClient:
+    def __init__(
+        self,
+        failed_folds: set[str] | None = None,
+        statuses: list[str] | None = None,
+        retrieve_error: Exception | None = None,
+    ) -> None:
+        self.failed_folds = failed_folds or set()
+        # batch status reported by create, then by each retrieve; the last one sticks
+        self.statuses = statuses or ["completed"]
+        self.retrieve_error = retrieve_error
+        self.retrieved = 0
+        self.cancelled = False
+        self.deleted: set[str] = set()
+        self.batch_input = ""
+        self.files = SimpleNamespace(
+            create=self.create_file, content=self.content, delete=self.delete_file
+        )
+        self.batches = SimpleNamespace(
+            create=self.create_batch, retrieve=self.retrieve, cancel=self.cancel
+        )
+
+    async def create_file(self, file: tuple[str, bytes], purpose: str) -> Any:
+        assert purpose == "batch"
+        self.batch_input = file[1].decode("utf-8")
+        return SimpleNamespace(id="file-in")
+
+    async def delete_file(self, file_id: str) -> Any:
+        self.deleted.add(file_id)
+        return SimpleNamespace(id=file_id, deleted=True)
+
+    async def create_batch(self, input_file_id: str, **kwargs: Any) -> Any:
+        assert input_file_id == "file-in"
+        return self.batch(self.statuses[0])
+
+    async def retrieve(self, batch_id: str) -> Any:
+        assert batch_id == "batch"
+        self.retrieved += 1
+        if self.retrieve_error is not None:
+            raise self.retrieve_error
+        return self.batch(self.statuses[min(self.retrieved, len(self.statuses) - 1)])
+
+    async def cancel(self, batch_id: str) -> Any:
+        assert batch_id == "batch"
+        self.cancelled = True
+        return self.batch("cancelling")
+
+    def batch(self, status: str) -> Any:
+        completed = status == "completed"
+        return SimpleNamespace(
+            id="batch",
+            status=status,
+            output_file_id="out" if completed else None,
+            error_file_id="err" if completed and self.failed_folds else None,
+        )
+
+    async def content(self, file_id: str) -> Any:
+        lines = []
+        # answer in reverse order, as the batch output is not guaranteed to be ordered
+        for line in reversed(self.batch_input.splitlines()):
+            request = json.loads(line)
+            failed = request["custom_id"] in self.failed_folds
+            if failed != (file_id == "err"):
+                continue
+            if failed:
+                lines.append(
+                    json.dumps({
+                        "custom_id": request["custom_id"],
+                        "response": {"status_code": 500, "body": {}},
+                        "error": None,
+                    })
+                )
+                continue
+            prompt = request["body"]["messages"][0]["content"]
+            body = {
+                "choices": [
+                    {
+                        "message": {
+                            "content": json.dumps({
+                                "reports": re.findall(r"report-(\d+)", prompt)
+                            })
+                        }
+                    }
+                ],
+                "usage": {"prompt_tokens": 10, "completion_tokens": 2},
+            }
+            lines.append(
+                json.dumps({
+                    "custom_id": request["custom_id"],
+                    "response": {"status_code": 200, "body": body},
+                })
+            )
+        return SimpleNamespace(text="\n".join(lines))
+
+
+class MockExpansionLLM:
+    async def agenerate(self, messages: list[Any], **kwargs: Any) -> str:
+        return "hypothetical answer"
+
+
+class MockTextEmbedder:
+    async def aembed(self, text: str, **kwargs: Any) -> list[float]:
+        return [float(len(text))]
+
+
+def create_reports(count: int) -> pd.DataFrame:
+    return pd.DataFrame({"full_content": [f"report-{i}" for i in range(count)]})
+
+
+async def test_primer_preserves_fold_order():
+    llm = MockChatLLM()
+    primer = DRIFTPrimer(
+        config=DRIFTSearchConfig(primer_folds=4),
+        chat_llm=llm,  # type: ignore
+        token_encoder=MockTokenEncoder(),  # type: ignore
+    )
+
+    reports = create_reports(8)
+    result = await primer.asearch("query", reports)
+
+    assert result.response == [
+        {"reports": ["0", "1"]},
+        {"reports": ["2", "3"]},
+        {"reports": ["4", "5"]},
+        {"reports": ["6", "7"]},
+    ]
+    assert result.llm_calls == 4
+    assert result.prompt_tokens > 0
+    assert result.output_tokens > 0
+    assert result.context_text == primer.fold_report_contents(reports)
+
+
+async def test_primer_bounds_concurrency():
+    llm = MockChatLLM()
+    primer = DRIFTPrimer(
+        config=DRIFTSearchConfig(primer_folds=6, primer_concurrency=2),
+        chat_llm=llm,  # type: ignore
+        token_encoder=MockTokenEncoder(),  # type: ignore
+    )
+
+    result = await primer.asearch("query", create_reports(6))
+
+    assert result.llm_calls == 6
+    assert llm.max_active == 2
+
+
+def test_primer_runs_on_separate_event_loops():
+    llm = MockChatLLM()
+    primer = DRIFTPrimer(
+        config=DRIFTSearchConfig(primer_folds=6, primer_concurrency=2),
+        chat_llm=llm,  # type: ignore
+        token_encoder=MockTokenEncoder(),  # type: ignore
+    )
+
+    for _ in range(2):
+        result = asyncio.run(primer.asearch("query", create_reports(6)))
+        assert result.llm_calls == 6
+    assert llm.max_active == 2
+
+
+def test_primer_concurrency_must_be_positive():
+    with pytest.raises(ValidationError):
+        DRIFTSearchConfig(primer_concurrency=0)
+
+
+@pytest.mark.parametrize("padding", [0, 128 * 1024])
+async def test_primer_parses_json(padding: int):
+    primer = DRIFTPrimer(
+        config=DRIFTSearchConfig(primer_folds=2),
+        chat_llm=MockPaddedChatLLM(padding),  # type: ignore
+        token_encoder=MockTokenEncoder(),  # type: ignore
+    )
+
+    result = await primer.asearch("query", create_reports(4))
+
+    assert [response["reports"] for response in result.response] == [
+        ["0", "1"],
+        ["2", "3"],
+    ]
+
+
+@pytest.mark.parametrize("padding", [0, 128 * 1024])
+async def test_primer_raises_on_malformed_json(padding: int):
+    primer = DRIFTPrimer(
+        config=DRIFTSearchConfig(primer_folds=2),
+        chat_llm=MockPaddedChatLLM(padding, fenced=True),  # type: ignore
+        token_encoder=MockTokenEncoder(),  # type: ignore
+    )
+
+    with pytest.raises(json.JSONDecodeError):
+        await primer.asearch("query", create_reports(4))
+
+
+async def test_primer_batch_api():
+    client = MockBatchClient()
+    llm = SimpleNamespace(model="gpt-4o", async_client=client)
+    primer = DRIFTPrimer(
+        config=DRIFTSearchConfig(primer_folds=2, primer_use_batch_api=True),
+        chat_llm=llm,  # type: ignore
+        token_encoder=MockTokenEncoder(),  # type: ignore
+    )
+
+    result = await primer.asearch("query", create_reports(4))
+
+    assert result.response == [{"reports": ["0", "1"]}, {"reports": ["2", "3"]}]
+    assert result.llm_calls == 2
+    assert result.prompt_tokens == 20
+    assert result.output_tokens == 4
+    assert client.deleted == {"file-in", "out"}
+
+
+async def test_primer_batch_api_skips_failed_folds():
+    client = MockBatchClient(failed_folds={"fold-1"})
+    llm = SimpleNamespace(model="gpt-4o", async_client=client)
+    primer = DRIFTPrimer(
+        config=DRIFTSearchConfig(primer_folds=3, primer_use_batch_api=True),
+        chat_llm=llm,  # type: ignore
+        token_encoder=MockTokenEncoder(),  # type: ignore
+    )
+
+    result = await primer.asearch("query", create_reports(6))
+
+    assert result.response == [{"reports": ["0", "1"]}, {"reports": ["4", "5"]}]
+    assert result.llm_calls == 2
+    assert result.prompt_tokens == 20
+    assert client.deleted == {"file-in", "out", "err"}
+
+
+async def test_primer_batch_api_all_folds_failed():
+    client = MockBatchClient(failed_folds={"fold-0"})
+    llm = SimpleNamespace(model="gpt-4o", async_client=client)
+    primer = DRIFTPrimer(
+        config=DRIFTSearchConfig(primer_folds=1, primer_use_batch_api=True),
+        chat_llm=llm,  # type: ignore
+        token_encoder=MockTokenEncoder(),  # type: ignore
+    )
+
+    with pytest.raises(RuntimeError, match="All requests"):
+        await primer.asearch("query", create_reports(2))
+    assert client.deleted == {"file-in", "out", "err"}
+
+
+@pytest.fixture
+def fast_batch_polling(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(primer_module, "_BATCH_MIN_POLL_INTERVAL", 0.001)
+
+
+@pytest.mark.usefixtures("fast_batch_polling")
+async def test_primer_batch_api_polls_until_completed():
+    client = MockBatchClient(statuses=["validating", "in_progress", "completed"])
+    llm = SimpleNamespace(model="gpt-4o", async_client=client)
+    primer = DRIFTPrimer(
+        config=DRIFTSearchConfig(primer_folds=2, primer_use_batch_api=True),
+        chat_llm=llm,  # type: ignore
+        token_encoder=MockTokenEncoder(),  # type: ignore
+    )
+
+    result = await primer.asearch("query", create_reports(4))
+
+    assert client.retrieved == 2
+    assert result.response == [{"reports": ["0", "1"]}, {"reports": ["2", "3"]}]
+
+
+@pytest.mark.usefixtures("fast_batch_polling")
+async def test_primer_batch_api_failed_status():
+    client = MockBatchClient(statuses=["in_progress", "failed"])
+    llm = SimpleNamespace(model="gpt-4o", async_client=client)
+    primer = DRIFTPrimer(
+        config=DRIFTSearchConfig(primer_folds=2, primer_use_batch_api=True),
+        chat_llm=llm,  # type: ignore
+        token_encoder=MockTokenEncoder(),  # type: ignore
+    )
+
+    with pytest.raises(RuntimeError, match="ended with status failed"):
+        await primer.asearch("query", create_reports(4))
+    assert not client.cancelled
+    assert client.deleted == {"file-in"}
+
+
+@pytest.mark.usefixtures("fast_batch_polling")
+async def test_primer_batch_api_timeout_cancels_batch():
+    client = MockBatchClient(statuses=["in_progress"])
+    llm = SimpleNamespace(model="gpt-4o", async_client=client)
+    primer = DRIFTPrimer(
+        config=DRIFTSearchConfig(
+            primer_folds=2, primer_use_batch_api=True, primer_batch_timeout=0.05
+        ),
+        chat_llm=llm,  # type: ignore
+        token_encoder=MockTokenEncoder(),  # type: ignore
+    )
+
+    with pytest.raises(TimeoutError):
+        await primer.asearch("query", create_reports(4))
+    assert client.cancelled
+    assert client.deleted == {"file-in"}
+
+
+@pytest.mark.usefixtures("fast_batch_polling")
+async def test_primer_batch_api_cancellation_cancels_batch():
+    client = MockBatchClient(statuses=["in_progress"])
+    llm = SimpleNamespace(model="gpt-4o", async_client=client)
+    primer = DRIFTPrimer(
+        config=DRIFTSearchConfig(primer_folds=2, primer_use_batch_api=True),
+        chat_llm=llm,  # type: ignore
+        token_encoder=MockTokenEncoder(),  # type: ignore
+    )
+
+    search = asyncio.ensure_future(primer.asearch("query", create_reports(4)))
+    while not client.retrieved:
+        await asyncio.sleep(0.001)
+    search.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await search
+    assert client.cancelled
+    assert client.deleted == {"file-in"}
+
+
+@pytest.mark.usefixtures("fast_batch_polling")
+async def test_primer_batch_api_polling_error_cancels_batch():
+    client = MockBatchClient(
+        statuses=["in_progress"], retrieve_error=ConnectionError("connection lost")
+    )
+    llm = SimpleNamespace(model="gpt-4o", async_client=client)
+    primer = DRIFTPrimer(
+        config=DRIFTSearchConfig(primer_folds=2, primer_use_batch_api=True),
+        chat_llm=llm,  # type: ignore
+        token_encoder=MockTokenEncoder(),  # type: ignore
+    )
+
+    with pytest.raises(ConnectionError):
+        await primer.asearch("query", create_reports(4))
+    assert client.cancelled
+    assert client.deleted == {"file-in"}
+
+
+def test_primer_batch_api_rejects_azure():
+    llm = SimpleNamespace(
+        model="gpt-4o",
+        async_client=AsyncAzureOpenAI(
+            api_key="key", api_version="2024-07-01-preview", azure_endpoint="http://x"
+        ),
+    )
+
+    with pytest.raises(ValueError, match="Azure"):
+        DRIFTPrimer(
+            config=DRIFTSearchConfig(primer_use_batch_api=True),
+            chat_llm=llm,  # type: ignore
+        )
+
+
+async def test_primer_query_processor():
+    reports = [
+        CommunityReport(
+            id=str(i),
+            short_id=str(i),
+            title=f"report {i}",
+            community_id=str(i),
+            summary="summary",
+            full_content=f"report-{i} content",
+        )
+        for i in range(3)
+    ]
+    processor = PrimerQueryProcessor(
+        chat_llm=MockExpansionLLM(),  # type: ignore
+        text_embedder=MockTextEmbedder(),  # type: ignore
+        reports=reports,
+        token_encoder=MockTokenEncoder(),  # type: ignore
+    )
+
+    embedding, token_ct = await processor("query")
+
+    assert embedding == [float(len("hypothetical answer"))]
+    assert token_ct["llm_calls"] == 1
+    assert token_ct["prompt_tokens"] > 0
+    assert token_ct["output_tokens"] == 2
+
+
+@pytest.mark.parametrize(
+    "dtype", [object, "string[pyarrow]", pd.ArrowDtype(pa.large_string())]
+)
+def test_split_reports(dtype: Any):
+    primer = DRIFTPrimer(
+        config=DRIFTSearchConfig(primer_folds=3),
+        chat_llm=MockChatLLM(),  # type: ignore
+    )
+    reports = create_reports(5).astype({"full_content": dtype})
+
+    assert primer.split_reports(reports) == [(0, 2), (2, 4), (4, 5)]
+    assert primer.fold_report_contents(reports) == [
+        "report-0\n\nreport-1",
+        "report-2\n\nreport-3",
+        "report-4",
+    ]
@@ -42,3 +42,8 @@ async def test_create_final_nodes():
     columns.remove("id")
     compare_outputs(actual, expected, columns)
     assert len(actual.columns) == len(expected.columns)
+    assert actual["x"].dtype == "float32"
+    assert actual["y"].dtype == "float32"
+    assert actual["level"].dtype == "int8"
+    # the join key cast must not leak into the output
+    assert actual["title"].dtype == "object"